@@ -1,9 +1,10 @@
 import signal
+import socket
 import sys
 from datetime import datetime
 from typing import Optional
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer
 from PySide6.QtWidgets import QApplication
 
 from . import __app_name__, __version__
@@ -21,7 +22,7 @@ from .core.settings import (
     add_history_record,
     get_settings,
 )
-from .core.transcript_processor import LLMProcessor
+from .core.transcript_processor import LLMProcessor, preload_litellm
 from .ui.download_dialog import DownloadDialog
 from .ui.main_window import SettingsWindow
 from .ui.recording_toast import RecordingToast
@@ -35,6 +36,9 @@ logger = get_logger(__name__)
 # Pattern to detect unknown/garbled tokens from the transcription model
 _UNK_TOKEN_PATTERN = "<unk>"
 
+# Recordings shorter than this are treated as accidental hotkey taps
+_MIN_RECORDING_SECONDS = 0.25
+
 
 class TranscribeApp(QObject):
 
@@ -144,6 +148,14 @@ class TranscribeApp(QObject):
             self._tray.set_status(TrayStatus.IDLE)
             return
 
+        min_samples = int(_MIN_RECORDING_SECONDS * self._settings.sample_rate)
+        if len(audio_data) < min_samples:
+            logger.info(
+                f"Recording too short ({len(audio_data)} samples), skipping transcription"
+            )
+            self._tray.set_status(TrayStatus.IDLE)
+            return
+
         logger.info(
             f"Captured {len(audio_data)} audio samples, starting background transcription"
         )
@@ -201,6 +213,7 @@ class TranscribeApp(QObject):
             or self._settings.llm_provider == "ollama"
         )
         if has_config:
+            preload_litellm()
             model_name = LLMProcessor.format_model_name(
                 self._settings.llm_model, self._settings.llm_provider
             )
@@ -257,7 +270,7 @@ class TranscribeApp(QObject):
             logger.info(
                 f"Reloading transcription engine (model: {old_model} -> {self._settings.model_id})"
             )
-            self._transcriber.unload()
+            self._transcriber.unload(free_memory=True)
 
             if self._settings_window is not None:
                 self._settings_window.set_loading(True)
@@ -269,7 +282,7 @@ class TranscribeApp(QObject):
     def _quit(self) -> None:
         logger.info("Shutting down application")
         self._hotkey_listener.stop()
-        self._transcriber.unload()
+        self._transcriber.unload(free_memory=True)
         self._tray.hide()
         self._recording_toast.hide()
         QApplication.quit()
@@ -341,11 +354,33 @@ class TranscribeApp(QObject):
         self._start_model_loading(self._settings.model_id)
 
 
+def _install_sigint_handler(app: QApplication) -> None:
+    # Route SIGINT through a socket so the Qt event loop wakes up immediately
+    # instead of waiting for the interpreter to run a Python-level handler.
+    reader, writer = socket.socketpair()
+    reader.setblocking(False)
+    writer.setblocking(False)
+    signal.set_wakeup_fd(writer.fileno())
+    signal.signal(signal.SIGINT, lambda *args: None)
+
+    def _on_wakeup() -> None:
+        try:
+            reader.recv(64)
+        except OSError:
+            pass
+        QApplication.quit()
+
+    notifier = QSocketNotifier(reader.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(_on_wakeup)
+    # Keep the socket pair alive for the lifetime of the application
+    app._sigint_sockets = (reader, writer)
+
+
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName("WhisperNow")
     app.setQuitOnLastWindowClosed(False)
-    signal.signal(signal.SIGINT, lambda *args: QApplication.quit())
+    _install_sigint_handler(app)
 
     settings = get_settings()
     if not settings.first_run_complete:
@@ -1,9 +1,10 @@
+import functools
 import json
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import numpy as np
 
@@ -17,6 +18,10 @@ from .file_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Quantized weights load and decode faster on CPU; models that only ship one
+# precision still fall back to whatever files are present.
+DEFAULT_CPU_PRECISION = "int8"
+
 
 def _load_models_json() -> list[dict]:
     models_path = Path(__file__).parent / "models" / "models.json"
@@ -26,23 +31,43 @@ def _load_models_json() -> list[dict]:
     return []
 
 
+@functools.lru_cache(maxsize=1)
+def _get_model_types() -> dict[str, Optional[str]]:
+    return {model.get("id"): model.get("type") for model in _load_models_json()}
+
+
 def get_model_type(model_id: str) -> str:
-    models = _load_models_json()
-    for model in models:
-        if model.get("id") == model_id:
-            model_type = model.get("type")
-            if not model_type:
-                raise ValueError(
-                    f"Model '{model_id}' in models.json is missing a 'type' field. "
-                    f"Please add 'type': 'whisper' or 'type': 'transducer' to the model entry."
-                )
-            return model_type
+    model_types = _get_model_types()
+    if model_id in model_types:
+        model_type = model_types[model_id]
+        if not model_type:
+            raise ValueError(
+                f"Model '{model_id}' in models.json is missing a 'type' field. "
+                f"Please add 'type': 'whisper' or 'type': 'transducer' to the model entry."
+            )
+        return model_type
     raise ValueError(
         f"Model '{model_id}' not found in models.json. "
         f"Please add an entry for this model with 'id', 'name', and 'type' fields."
     )
 
 
+def to_float32_audio(audio_data: np.ndarray) -> np.ndarray:
+    """Convert audio to float32 in [-1, 1], reusing the buffer when possible."""
+    if audio_data.dtype == np.int16:
+        audio_float = audio_data.astype(np.float32)
+        audio_float *= 1.0 / 32768.0
+        return audio_float
+    return audio_data.astype(np.float32, copy=False)
+
+
+def to_mono_float32_audio(audio_data: np.ndarray) -> np.ndarray:
+    """Contiguous mono float32 audio, keeping the first channel of multi-channel input."""
+    if audio_data.ndim > 1:
+        audio_data = audio_data[:, 0]
+    return np.ascontiguousarray(to_float32_audio(audio_data))
+
+
 @dataclass
 class TranscriptionResult:
     text: str
@@ -52,6 +77,14 @@ class TranscriptionResult:
     durations: Optional[list] = None
 
 
+def prefer_precision(candidates: list[str], precision: Optional[str]) -> list[str]:
+    """Reorder model file candidates so the ``precision`` variant is tried first."""
+    if not precision:
+        return list(candidates)
+    tag = f".{precision}."
+    return sorted(candidates, key=lambda name: tag not in name)
+
+
 class SherpaOnnxBackend:
     def __init__(self):
         self._recognizer = None
@@ -61,6 +94,7 @@ class SherpaOnnxBackend:
         self,
         model_path: str,
         on_progress: Optional[Callable[[float], None]] = None,
+        precision: Optional[str] = DEFAULT_CPU_PRECISION,
     ) -> None:
         import sherpa_onnx
 
@@ -81,22 +115,32 @@ class SherpaOnnxBackend:
         logger.info(f"Loading model '{model_id}' as type '{model_type}'")
 
         self._device = "cpu"
-        logger.info("Loading model with CPU provider")
+        logger.info(
+            f"Loading model with CPU provider (preferring {precision or 'default'} weights)"
+        )
 
         try:
             if model_type == "whisper":
-                self._load_whisper_model(sherpa_onnx, full_model_path)
+                self._load_whisper_model(sherpa_onnx, full_model_path, precision)
             else:
-                self._load_transducer_model(sherpa_onnx, full_model_path)
+                self._load_transducer_model(sherpa_onnx, full_model_path, precision)
         except Exception as e:
             self._recognizer = None
             raise RuntimeError(
                 f"Failed to load model from '{full_model_path}': {e}"
             ) from e
 
-    def _load_whisper_model(self, sherpa_onnx, model_path: str) -> None:
-        encoder = find_file_by_suffix(model_path, "-encoder.onnx", "-encoder.int8.onnx")
-        decoder = find_file_by_suffix(model_path, "-decoder.onnx", "-decoder.int8.onnx")
+    def _load_whisper_model(
+        self, sherpa_onnx, model_path: str, precision: Optional[str] = None
+    ) -> None:
+        encoder = find_file_by_suffix(
+            model_path,
+            *prefer_precision(["-encoder.onnx", "-encoder.int8.onnx"], precision),
+        )
+        decoder = find_file_by_suffix(
+            model_path,
+            *prefer_precision(["-decoder.onnx", "-decoder.int8.onnx"], precision),
+        )
         tokens = find_file_by_suffix(model_path, "-tokens", "tokens.txt")
 
         if not encoder or not decoder or not tokens:
@@ -125,15 +169,18 @@ class SherpaOnnxBackend:
             decoding_method="greedy_search",
         )
 
-    def _load_transducer_model(self, sherpa_onnx, model_path: str) -> None:
-        encoder = find_file_exact(
-            model_path, ["encoder.onnx", "encoder.int8.onnx", "encoder.fp16.onnx"]
-        )
-        decoder = find_file_exact(
-            model_path, ["decoder.onnx", "decoder.int8.onnx", "decoder.fp16.onnx"]
-        )
-        joiner = find_file_exact(
-            model_path, ["joiner.onnx", "joiner.int8.onnx", "joiner.fp16.onnx"]
+    def _load_transducer_model(
+        self, sherpa_onnx, model_path: str, precision: Optional[str] = None
+    ) -> None:
+        encoder, decoder, joiner = (
+            find_file_exact(
+                model_path,
+                prefer_precision(
+                    [f"{part}.onnx", f"{part}.int8.onnx", f"{part}.fp16.onnx"],
+                    precision,
+                ),
+            )
+            for part in ("encoder", "decoder", "joiner")
         )
         tokens = find_file_exact(model_path, ["tokens.txt"])
 
@@ -173,22 +220,31 @@ class SherpaOnnxBackend:
         if self._recognizer is None:
             raise RuntimeError("Model not loaded. Call load() first.")
 
-        if audio_data.dtype == np.int16:
-            audio_float = audio_data.astype(np.float32) / 32768.0
-        else:
-            audio_float = audio_data.astype(np.float32)
+        stream = self._create_stream(audio_data, sample_rate)
+        self._recognizer.decode_stream(stream)
 
-        if audio_float.ndim > 1:
-            audio_float = (
-                audio_float[:, 0] if audio_float.shape[1] > 1 else audio_float.flatten()
-            )
+        return self._to_result(stream.result)
+
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int = 16000
+    ) -> List[TranscriptionResult]:
+        if self._recognizer is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        streams = [self._create_stream(chunk, sample_rate) for chunk in audio_chunks]
+        self._recognizer.decode_streams(streams)
+
+        return [self._to_result(stream.result) for stream in streams]
+
+    def _create_stream(self, audio_data: np.ndarray, sample_rate: int):
+        audio_float = to_mono_float32_audio(audio_data)
 
         stream = self._recognizer.create_stream()
         stream.accept_waveform(sample_rate, audio_float)
-        self._recognizer.decode_stream(stream)
-
-        result = stream.result
+        return stream
 
+    @staticmethod
+    def _to_result(result) -> TranscriptionResult:
         timestamps = None
         tokens = None
         durations = None
@@ -219,7 +275,8 @@ class SherpaOnnxBackend:
     def device(self) -> str:
         return self._device
 
-    def is_model_cached(self, model_path: str) -> bool:
+    @staticmethod
+    def is_model_cached(model_path: str) -> bool:
         if not os.path.isabs(model_path):
             full_model_path = os.path.join(get_models_dir(), model_path)
             model_id = model_path
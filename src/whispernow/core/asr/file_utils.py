@@ -10,17 +10,28 @@ def get_models_dir() -> str:
     )
 
 
-def find_file_by_suffix(directory: str, *suffixes: str) -> Optional[str]:
+def _list_model_files(directory: str) -> list[str]:
     try:
-        for filename in os.listdir(directory):
-            for suffix in suffixes:
-                if filename.endswith(suffix):
-                    return os.path.join(directory, filename)
+        return sorted(os.listdir(directory))
     except OSError:
-        pass
+        return []
+
+
+def _match_suffix(
+    directory: str, filenames: list[str], suffixes: tuple[str, ...]
+) -> Optional[str]:
+    # Suffixes are in priority order, so the result doesn't depend on listdir order.
+    for suffix in suffixes:
+        for filename in filenames:
+            if filename.endswith(suffix):
+                return os.path.join(directory, filename)
     return None
 
 
+def find_file_by_suffix(directory: str, *suffixes: str) -> Optional[str]:
+    return _match_suffix(directory, _list_model_files(directory), suffixes)
+
+
 def has_file_with_suffix(directory: str, *suffixes: str) -> bool:
     return find_file_by_suffix(directory, *suffixes) is not None
 
@@ -33,49 +44,49 @@ def find_file_exact(directory: str, candidates: list[str]) -> Optional[str]:
     return None
 
 
+# The validity checks below list the model directory once and test every
+# required file against that listing, rather than hitting the filesystem
+# per file; they back the download status shown for each model in the UI.
 def is_valid_whisper_model(model_path: str) -> bool:
-    has_encoder = has_file_with_suffix(
-        model_path, "-encoder.onnx", "-encoder.int8.onnx"
-    )
-    has_decoder = has_file_with_suffix(
-        model_path, "-decoder.onnx", "-decoder.int8.onnx"
+    filenames = _list_model_files(model_path)
+    return all(
+        _match_suffix(model_path, filenames, suffixes) is not None
+        for suffixes in (
+            ("-encoder.onnx", "-encoder.int8.onnx"),
+            ("-decoder.onnx", "-decoder.int8.onnx"),
+            ("-tokens", "tokens.txt"),
+        )
     )
-    has_tokens = has_file_with_suffix(model_path, "-tokens", "tokens.txt")
-    return has_encoder and has_decoder and has_tokens
 
 
 def is_valid_transducer_model(model_path: str) -> bool:
-    has_encoder = (
-        find_file_exact(
-            model_path, ["encoder.onnx", "encoder.int8.onnx", "encoder.fp16.onnx"]
-        )
-        is not None
-    )
-    has_decoder = (
-        find_file_exact(
-            model_path, ["decoder.onnx", "decoder.int8.onnx", "decoder.fp16.onnx"]
-        )
-        is not None
-    )
-    has_joiner = (
-        find_file_exact(
-            model_path, ["joiner.onnx", "joiner.int8.onnx", "joiner.fp16.onnx"]
+    filenames = set(_list_model_files(model_path))
+    return "tokens.txt" in filenames and all(
+        not filenames.isdisjoint(
+            (f"{part}.onnx", f"{part}.int8.onnx", f"{part}.fp16.onnx")
         )
-        is not None
+        for part in ("encoder", "decoder", "joiner")
     )
-    has_tokens = os.path.exists(os.path.join(model_path, "tokens.txt"))
-    return has_encoder and has_decoder and has_joiner and has_tokens
 
 
 def is_valid_model_dir(model_path: str) -> bool:
-    has_tokens = has_file_with_suffix(model_path, "-tokens.txt", "tokens.txt")
-    has_encoder = has_file_with_suffix(
-        model_path,
-        "-encoder.onnx",
-        "-encoder.int8.onnx",
-        "-encoder.fp16.onnx",
-        "encoder.onnx",
-        "encoder.int8.onnx",
-        "encoder.fp16.onnx",
+    filenames = _list_model_files(model_path)
+    has_tokens = (
+        _match_suffix(model_path, filenames, ("-tokens.txt", "tokens.txt")) is not None
+    )
+    has_encoder = (
+        _match_suffix(
+            model_path,
+            filenames,
+            (
+                "-encoder.onnx",
+                "-encoder.int8.onnx",
+                "-encoder.fp16.onnx",
+                "encoder.onnx",
+                "encoder.int8.onnx",
+                "encoder.fp16.onnx",
+            ),
+        )
+        is not None
     )
     return has_tokens and has_encoder
@@ -26,7 +26,7 @@ class ModelLoaderThread(QThread):
                 on_download_progress=self._on_progress,
             )
 
-            self._engine.load_model()
+            self._engine.load_model(warm_up=True)
 
             message = "Model loaded on CPU"
             logger.info(f"Background model loading complete: {message}")
@@ -1,13 +1,90 @@
 import gc
+import os
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum, auto
-from typing import Callable, Optional
+from itertools import islice
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 
 from ...utils.logger import get_logger
 from ..audio.audio_processor import AudioProcessor, needs_chunking
-from .backends import SherpaOnnxBackend, TranscriptionResult
+from .backends import (
+    DEFAULT_CPU_PRECISION,
+    SherpaOnnxBackend,
+    TranscriptionResult,
+    to_mono_float32_audio,
+)
+
+# Number of chunks decoded together when transcribing long recordings.
+TRANSCRIBE_BATCH_SIZE = 4
+
+# Length of the silent clip decoded right after loading a model, so the ONNX
+# runtime's lazy first-run setup doesn't land on the user's first recording.
+WARMUP_SECONDS = 0.5
+
+logger = get_logger(__name__)
+
+
+def _model_cache_size() -> int:
+    value = os.environ.get("WHISPERNOW_MODEL_CACHE", "0")
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid WHISPERNOW_MODEL_CACHE={value!r}; expected an integer"
+        )
+        return 0
+
+
+# Number of idle, already-loaded backends kept around for fast model switching.
+# Each one holds a full model in memory, so this is off unless opted into with
+# the WHISPERNOW_MODEL_CACHE environment variable.
+MODEL_CACHE_SIZE = _model_cache_size()
+
+_backend_cache: "OrderedDict[Tuple[str, str, Optional[str]], SherpaOnnxBackend]" = (
+    OrderedDict()
+)
+_backend_cache_lock = threading.Lock()
+
+
+def _take_cached_backend(
+    key: Tuple[str, str, Optional[str]],
+) -> Optional[SherpaOnnxBackend]:
+    with _backend_cache_lock:
+        return _backend_cache.pop(key, None)
+
+
+def _free_backends(backends: List[SherpaOnnxBackend]) -> None:
+    if not backends:
+        return
+    for stale in backends:
+        stale.unload()
+    # Only worth a full collection when model memory is actually being freed.
+    gc.collect()
+
+
+def _release_backend(
+    key: Tuple[str, str, Optional[str]], backend: SherpaOnnxBackend
+) -> None:
+    evicted = []
+    with _backend_cache_lock:
+        _backend_cache[key] = backend
+        _backend_cache.move_to_end(key)
+        while len(_backend_cache) > MODEL_CACHE_SIZE:
+            evicted.append(_backend_cache.popitem(last=False)[1])
+
+    _free_backends(evicted)
+
+
+def clear_backend_cache() -> None:
+    with _backend_cache_lock:
+        evicted = list(_backend_cache.values())
+        _backend_cache.clear()
+
+    _free_backends(evicted)
 
 
 class EngineState(Enum):
@@ -27,8 +104,10 @@ class TranscriptionEngine:
         model_name: str = "sherpa-onnx-nemo-parakeet-tdt-0.6b-v2-fp16",
         on_state_change: Optional[Callable[[EngineState, str], None]] = None,
         on_download_progress: Optional[Callable[[float], None]] = None,
+        precision: Optional[str] = DEFAULT_CPU_PRECISION,
     ):
         self.model_name = model_name
+        self.precision = precision
         self.on_state_change = on_state_change
         self.on_download_progress = on_download_progress
         self._backend: Optional[SherpaOnnxBackend] = None
@@ -55,24 +134,41 @@ class TranscriptionEngine:
     def backend_name(self) -> str:
         return self.BACKEND_NAME
 
+    @property
+    def _cache_key(self) -> Tuple[str, str, Optional[str]]:
+        return (self.BACKEND_NAME, self.model_name, self.precision)
+
     def _set_state(self, state: EngineState, message: str = "") -> None:
         self._state = state
         if self.on_state_change:
             self.on_state_change(state, message)
 
-    def load_model(self) -> bool:
+    def load_model(self, warm_up: bool = False) -> bool:
+        """Load the model, reusing a cached backend when one is available.
+
+        ``warm_up=True`` also decodes a short silent clip after a fresh load;
+        only worth it when loading ahead of time, not right before real audio.
+        """
         if self._backend is not None and self._backend.is_loaded:
             return True
 
-        self._set_state(
-            EngineState.LOADING,
-            f"Loading {self.backend_name} model: {self.model_name}...",
-        )
-        self._backend = SherpaOnnxBackend()
-        self._backend.load(
-            model_path=self.model_name,
-            on_progress=self.on_download_progress,
-        )
+        cached = _take_cached_backend(self._cache_key)
+        if cached is not None and cached.is_loaded:
+            self.logger.info(f"Reusing cached model: {self.model_name}")
+            self._backend = cached
+        else:
+            self._set_state(
+                EngineState.LOADING,
+                f"Loading {self.backend_name} model: {self.model_name}...",
+            )
+            self._backend = SherpaOnnxBackend()
+            self._backend.load(
+                model_path=self.model_name,
+                on_progress=self.on_download_progress,
+                precision=self.precision,
+            )
+            if warm_up:
+                self._warm_up()
 
         self._set_state(
             EngineState.READY,
@@ -80,6 +176,15 @@ class TranscriptionEngine:
         )
         return True
 
+    def _warm_up(self, sample_rate: int = 16000) -> None:
+        try:
+            self._backend.transcribe(
+                np.zeros(int(WARMUP_SECONDS * sample_rate), dtype=np.float32),
+                sample_rate,
+            )
+        except Exception as e:
+            self.logger.warning(f"Model warm-up failed: {e}")
+
     def transcribe(
         self, audio_data: np.ndarray, sample_rate: int = 16000
     ) -> Optional[str]:
@@ -130,20 +235,64 @@ class TranscriptionEngine:
 
         logger = get_logger(__name__)
 
-        chunks = self._audio_processor.split_audio(audio_data, sample_rate)
-        logger.info(f"Processing {len(chunks)} audio chunks")
+        # Convert once up front so every chunk is a mono float32 view the
+        # backend can consume without another copy.
+        audio_data = to_mono_float32_audio(audio_data)
+        chunks = self._audio_processor.split_audio_iter(audio_data, sample_rate)
         transcriptions = []
-        for i, chunk in enumerate(chunks):
-            logger.debug(f"Transcribing chunk {i+1}/{len(chunks)}")
-            text = self.transcribe(chunk, sample_rate)
-            if text:
-                transcriptions.append(text)
+        chunk_count = 0
+        while batch := [chunk for _, chunk in islice(chunks, TRANSCRIBE_BATCH_SIZE)]:
+            logger.debug(
+                f"Transcribing chunks {chunk_count+1}-{chunk_count+len(batch)}"
+            )
+            chunk_count += len(batch)
+            texts = self.transcribe_batch(batch, sample_rate)
+            if texts:
+                transcriptions.extend(text for text in texts if text)
+        logger.info(f"Processed {chunk_count} audio chunks")
 
         combined = self._audio_processor.combine_transcriptions(transcriptions)
         logger.info(f"Combined {len(transcriptions)} transcriptions")
 
         return combined
 
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int = 16000
+    ) -> Optional[List[str]]:
+        if not self.is_ready:
+            try:
+                self.load_model()
+            except Exception as e:
+                self._set_state(EngineState.ERROR, f"Failed to load model: {e}")
+                return None
+
+        self._set_state(EngineState.PROCESSING, "Transcribing...")
+
+        start_time = time.time()
+
+        try:
+            results = self._backend.transcribe_batch(
+                audio_chunks=audio_chunks, sample_rate=sample_rate
+            )
+
+            processing_time = time.time() - start_time
+            audio_duration = sum(len(chunk) for chunk in audio_chunks) / sample_rate
+
+            if processing_time > 0:
+                rtf = audio_duration / processing_time
+                self.logger.debug(
+                    f"Batch transcription finished: chunks={len(audio_chunks)}, "
+                    f"audio_len={audio_duration:.2f}s, "
+                    f"time={processing_time:.2f}s, speed={rtf:.2f}x"
+                )
+
+            self._set_state(EngineState.READY, "Ready")
+            return [result.text for result in results]
+
+        except Exception as e:
+            self._set_state(EngineState.ERROR, f"Transcription failed: {e}")
+            return None
+
     def transcribe_with_metadata(
         self, audio_data: np.ndarray, sample_rate: int = 16000
     ) -> Optional[TranscriptionResult]:
@@ -180,12 +329,20 @@ class TranscriptionEngine:
             self._set_state(EngineState.ERROR, f"Transcription failed: {e}")
             return None
 
-    def unload(self) -> None:
+    def unload(self, free_memory: bool = False) -> None:
+        """Unload the model.
+
+        The backend is parked in the backend cache when one is enabled
+        (``MODEL_CACHE_SIZE`` > 0); otherwise, or with ``free_memory=True``,
+        its memory is released right away.
+        """
         if self._backend is not None:
-            self._backend.unload()
+            if free_memory:
+                _free_backends([self._backend])
+            elif self._backend.is_loaded:
+                _release_backend(self._cache_key, self._backend)
             self._backend = None
 
-        gc.collect()
         self._set_state(EngineState.NOT_LOADED, "Model unloaded")
 
     def switch_model(self, model_name: str) -> bool:
@@ -194,5 +351,4 @@ class TranscriptionEngine:
         return self.load_model()
 
     def is_model_cached(self) -> bool:
-        backend = SherpaOnnxBackend()
-        return backend.is_model_cached(self.model_name)
+        return SherpaOnnxBackend.is_model_cached(self.model_name)
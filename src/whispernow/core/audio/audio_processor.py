@@ -1,5 +1,7 @@
+import logging
+import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 
@@ -14,6 +16,12 @@ SILENCE_THRESHOLD = 0.02
 SILENCE_DURATION_SECONDS = 0.3
 OVERLAP_DURATION_SECONDS = 0.1
 
+# Silence detection only needs the loudness envelope, so it is analysed at
+# roughly this rate regardless of the recording's sample rate.
+ANALYSIS_SAMPLE_RATE = 8000
+
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
 
 @dataclass
 class AudioChunkInfo:
@@ -44,6 +52,40 @@ class AudioPreview:
         return f"{seconds}s"
 
 
+def _moving_average(values: np.ndarray, window_size: int) -> np.ndarray:
+    """Boxcar average equivalent to ``np.convolve(values, ones(w) / w, "same")``.
+
+    Uses a zero-padded cumulative sum, so the cost is O(N) regardless of the
+    window size.
+    """
+    n = len(values)
+    left_pad = window_size - 1 - (window_size - 1) // 2
+
+    cumsum = np.empty(n + window_size, dtype=np.float64)
+    cumsum[: left_pad + 1] = 0.0
+    np.cumsum(values, dtype=np.float64, out=cumsum[left_pad + 1 : left_pad + 1 + n])
+    cumsum[left_pad + 1 + n :] = cumsum[left_pad + n]
+
+    smooth = cumsum[window_size:] - cumsum[:n]
+    smooth *= 1.0 / window_size
+    return smooth.astype(np.float32)
+
+
+def _block_mean(values: np.ndarray, block_size: int) -> np.ndarray:
+    """Mean of each consecutive ``block_size`` run of ``values`` as float32."""
+    # Summing strided views is far faster than np.add.reduceat for the
+    # small block sizes used here.
+    means = values[::block_size].astype(np.float32)
+    for offset in range(1, block_size):
+        part = values[offset::block_size]
+        means[: len(part)] += part
+    means *= 1.0 / block_size
+    tail = len(values) % block_size
+    if tail:
+        means[-1] *= block_size / tail
+    return means
+
+
 def needs_chunking(audio_data: np.ndarray, sample_rate: int) -> bool:
     duration = len(audio_data) / sample_rate
     return duration > MAX_DURATION_SECONDS
@@ -112,13 +154,24 @@ class AudioProcessor:
         )
 
     def split_audio(self, audio_data: np.ndarray, sample_rate: int) -> List[np.ndarray]:
+        chunks = [chunk for _, chunk in self.split_audio_iter(audio_data, sample_rate)]
+
+        if len(chunks) > 1:
+            logger.info(f"Split audio into {len(chunks)} chunks")
+        return chunks
+
+    def split_audio_iter(
+        self, audio_data: np.ndarray, sample_rate: int
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Lazily yield ``(start_sample, chunk)`` pairs as contiguous views."""
         duration = len(audio_data) / sample_rate
 
         if duration <= self.max_duration:
             logger.debug(
                 f"Audio duration {duration:.1f}s under threshold, no splitting needed"
             )
-            return [audio_data]
+            yield 0, audio_data
+            return
 
         logger.info(f"Splitting {duration:.1f}s audio into chunks...")
 
@@ -132,35 +185,44 @@ class AudioProcessor:
                 len(audio_data), sample_rate
             )
 
-        chunks = self._create_chunks(audio_data, sample_rate, split_points)
-
-        logger.info(f"Split audio into {len(chunks)} chunks")
-        return chunks
+        yield from self._iter_chunks(audio_data, sample_rate, split_points)
 
     def _find_split_points(self, audio_data: np.ndarray, sample_rate: int) -> List[int]:
-        max_chunk_samples = int(self.max_duration * sample_rate)
-        min_chunk_samples = int(self.min_chunk_duration * sample_rate)
-        silence_samples = int(self.silence_duration * sample_rate)
-
         if audio_data.ndim > 1:
-            analysis_audio = np.mean(audio_data, axis=1)
+            # Downmix straight into the float32 envelope and rectify in place
+            audio_abs = np.mean(audio_data, axis=1, dtype=np.float32)
+            np.abs(audio_abs, out=audio_abs)
+        elif audio_data.dtype == np.int16:
+            # abs() wraps -32768 onto itself, which reads back as 32768 when
+            # viewed unsigned, so the envelope stays at 2 bytes per sample.
+            audio_abs = np.abs(audio_data).view(np.uint16)
         else:
-            analysis_audio = audio_data
+            audio_abs = np.empty(len(audio_data), dtype=np.float32)
+            np.abs(audio_data, out=audio_abs, dtype=np.float32)
 
-        audio_float = analysis_audio.astype(np.float32)
-        max_val = np.max(np.abs(audio_float))
+        # Scale the threshold to the peak level rather than normalizing the
+        # envelope; silence quality ranking does not depend on the scale.
+        max_val = float(audio_abs.max()) if len(audio_abs) else 0.0
+        silence_threshold = self.silence_threshold
         if max_val > 0:
-            audio_normalized = audio_float / max_val
-        else:
-            audio_normalized = audio_float
-
-        audio_abs = np.abs(audio_normalized)
-
-        window_size = int(0.1 * sample_rate)
-        if window_size > 1 and len(audio_abs) > window_size:
-            audio_smooth = np.convolve(
-                audio_abs, np.ones(window_size) / window_size, mode="same"
-            )
+            silence_threshold *= max_val
+
+        # Average the envelope down to the analysis rate; block means keep
+        # every sample's energy, unlike plain striding which can alias tones
+        # onto their zero crossings.
+        decimation = max(1, sample_rate // ANALYSIS_SAMPLE_RATE)
+        if decimation > 1:
+            audio_abs = _block_mean(audio_abs, decimation)
+        analysis_rate = sample_rate / decimation
+        total_samples = len(audio_abs)
+
+        max_chunk_samples = int(self.max_duration * analysis_rate)
+        min_chunk_samples = int(self.min_chunk_duration * analysis_rate)
+        silence_samples = int(self.silence_duration * analysis_rate)
+
+        window_size = int(0.1 * analysis_rate)
+        if window_size > 1 and total_samples > window_size:
+            audio_smooth = _moving_average(audio_abs, window_size)
         else:
             audio_smooth = audio_abs
 
@@ -168,16 +230,21 @@ class AudioProcessor:
         last_split = 0
 
         search_start = min_chunk_samples
-        while search_start < len(audio_data):
-            if len(audio_data) - last_split <= max_chunk_samples:
+        while search_start < total_samples:
+            if total_samples - last_split <= max_chunk_samples:
                 break
 
             search_end = min(
-                search_start + max_chunk_samples - min_chunk_samples, len(audio_data)
+                search_start + max_chunk_samples - min_chunk_samples, total_samples
             )
 
             best_split = self._find_best_silence(
-                audio_smooth, search_start, search_end, silence_samples, sample_rate
+                audio_smooth,
+                search_start,
+                search_end,
+                silence_samples,
+                analysis_rate,
+                silence_threshold=silence_threshold,
             )
 
             if best_split is not None:
@@ -185,15 +252,15 @@ class AudioProcessor:
                 last_split = best_split
                 search_start = best_split + min_chunk_samples
             else:
-                forced_split = min(last_split + max_chunk_samples, len(audio_data) - 1)
-                if forced_split < len(audio_data) - min_chunk_samples:
+                forced_split = min(last_split + max_chunk_samples, total_samples - 1)
+                if forced_split < total_samples - min_chunk_samples:
                     split_points.append(forced_split)
                     last_split = forced_split
                     search_start = forced_split + min_chunk_samples
                 else:
                     break
 
-        return split_points
+        return [point * decimation for point in split_points]
 
     def _find_best_silence(
         self,
@@ -202,65 +269,104 @@ class AudioProcessor:
         end: int,
         silence_samples: int,
         sample_rate: int,
+        silence_threshold: Optional[float] = None,
     ) -> Optional[int]:
+        if silence_threshold is None:
+            silence_threshold = self.silence_threshold
+
         step = int(0.05 * sample_rate)
         if step < 1:
             step = 1
 
-        best_silence_start = None
-        best_silence_quality = float("inf")
-
-        for i in range(end - silence_samples, start, -step):
-            if i < 0 or i + silence_samples >= len(audio_smooth):
-                continue
-
-            silence_region = audio_smooth[i : i + silence_samples]
-            max_level = np.max(silence_region)
-            avg_level = np.mean(silence_region)
-
-            if max_level < self.silence_threshold:
-                silence_quality = avg_level + (max_level * 0.1)
-
-                if silence_quality < best_silence_quality:
-                    best_silence_quality = silence_quality
-                    best_silence_start = i + silence_samples // 2
-
-        return best_silence_start
+        candidates = np.arange(end - silence_samples, start, -step)
+        candidates = candidates[
+            (candidates >= 0) & (candidates + silence_samples < len(audio_smooth))
+        ]
+        if len(candidates) == 0:
+            return None
+
+        # Split the searched span at every window edge and reduce each block
+        # once; window sums and maxima are then assembled from block values,
+        # so the audio is scanned a single time regardless of window overlap.
+        starts = candidates[::-1] - candidates[-1]
+        segment = audio_smooth[candidates[-1] : candidates[0] + silence_samples]
+        edges = np.union1d(starts, starts + silence_samples)[:-1]
+        block_sums = np.add.reduceat(segment, edges, dtype=np.float64)
+        block_maxes = np.maximum.reduceat(segment, edges)
+
+        first_block = np.searchsorted(edges, starts)
+        end_block = np.searchsorted(edges, starts + silence_samples)
+        sum_prefix = np.concatenate(([0.0], np.cumsum(block_sums)))
+        avg_levels = (sum_prefix[end_block] - sum_prefix[first_block]) / silence_samples
+
+        block_counts = end_block - first_block
+        block_offsets = np.arange(block_counts.max())
+        block_idx = np.minimum(
+            first_block[:, None] + block_offsets, len(block_maxes) - 1
+        )
+        max_levels = np.where(
+            block_offsets < block_counts[:, None], block_maxes[block_idx], -np.inf
+        ).max(axis=1)
+
+        # Scan from the end of the range so ties favour later split points
+        quality = np.where(
+            max_levels < silence_threshold,
+            avg_levels + (max_levels * 0.1),
+            np.inf,
+        )[::-1]
+        best = int(np.argmin(quality))
+        if not np.isfinite(quality[best]):
+            return None
+
+        return int(candidates[best]) + silence_samples // 2
 
     def _generate_time_based_splits(
         self, total_samples: int, sample_rate: int
     ) -> List[int]:
         target_samples = int(self.max_duration * sample_rate * 0.9)
+        min_tail_samples = int(self.min_chunk_duration * sample_rate)
 
-        split_points = []
-        current_pos = target_samples
-
-        while current_pos < total_samples - int(self.min_chunk_duration * sample_rate):
-            split_points.append(current_pos)
-            current_pos += target_samples
-
-        return split_points
+        return np.arange(
+            target_samples,
+            total_samples - min_tail_samples,
+            target_samples,
+            dtype=np.int64,
+        ).tolist()
 
     def _create_chunks(
         self, audio_data: np.ndarray, sample_rate: int, split_points: List[int]
     ) -> List[np.ndarray]:
-        chunks = []
+        return [
+            chunk
+            for _, chunk in self._iter_chunks(audio_data, sample_rate, split_points)
+        ]
+
+    def _iter_chunks(
+        self, audio_data: np.ndarray, sample_rate: int, split_points: List[int]
+    ) -> Iterator[Tuple[int, np.ndarray]]:
         overlap_samples = int(self.overlap_duration * sample_rate)
+        total_samples = len(audio_data)
 
-        start_idx = 0
-        for i, end_idx in enumerate(split_points + [len(audio_data)]):
-            chunk_start = max(0, start_idx - (overlap_samples if i > 0 else 0))
-            chunk_end = min(len(audio_data), end_idx + overlap_samples)
+        bounds = np.asarray(split_points, dtype=np.int64)
+        chunk_starts = np.maximum(np.concatenate(([0], bounds)) - overlap_samples, 0)
+        chunk_starts[0] = 0
+        chunk_ends = np.minimum(
+            np.concatenate((bounds, [total_samples])) + overlap_samples, total_samples
+        )
+        log_chunks = logger.isEnabledFor(logging.DEBUG)
 
-            chunk_data = audio_data[chunk_start:chunk_end]
-            chunks.append(chunk_data)
+        for i, (chunk_start, chunk_end) in enumerate(
+            zip(chunk_starts.tolist(), chunk_ends.tolist())
+        ):
+            # A no-op for the usual C-ordered recordings; guarantees backends
+            # never have to make their own contiguous copy.
+            chunk_data = np.ascontiguousarray(audio_data[chunk_start:chunk_end])
 
-            chunk_duration = len(chunk_data) / sample_rate
-            logger.debug(f"Created chunk {i+1}: {chunk_duration:.1f}s")
+            if log_chunks:
+                chunk_duration = len(chunk_data) / sample_rate
+                logger.debug(f"Created chunk {i+1}: {chunk_duration:.1f}s")
 
-            start_idx = end_idx
-
-        return chunks
+            yield chunk_start, chunk_data
 
     def combine_transcriptions(self, transcriptions: List[str]) -> str:
         if not transcriptions:
@@ -271,18 +377,7 @@ class AudioProcessor:
         if not valid_transcriptions:
             return ""
 
-        combined = ""
-        for i, transcription in enumerate(valid_transcriptions):
-            if i > 0:
-                if not combined.endswith(" ") and not transcription.startswith(" "):
-                    combined += " "
-
-            combined += transcription
-
-        while "  " in combined:
-            combined = combined.replace("  ", " ")
-
-        return combined.strip()
+        return _WHITESPACE_RUN.sub(" ", " ".join(valid_transcriptions))
 
 
 _audio_processor: Optional[AudioProcessor] = None
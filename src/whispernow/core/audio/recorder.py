@@ -1,9 +1,27 @@
+import functools
+import time
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 import sounddevice as sd
 
+# Initial recording buffer capacity; doubled whenever a recording outgrows it
+BUFFER_SECONDS = 60
+
+# Audio is captured as 16-bit PCM, half the memory of float32; the ASR side
+# converts to float32 once, when transcription starts.
+CAPTURE_DTYPE = np.int16
+INT16_SCALE = 1.0 / 32768.0
+
+# Minimum audio time between level/spectrum updates. The UI polls the latest
+# values every 50 ms, so metering every callback block is wasted work.
+METER_INTERVAL_SECONDS = 0.025
+
+# How long a device name -> index lookup is reused before PortAudio is queried
+# again; keeps host enumeration off the hotkey-to-recording path.
+DEVICE_CACHE_SECONDS = 5.0
+
 
 @dataclass
 class AudioDevice:
@@ -31,7 +49,10 @@ class AudioRecorder:
         self.on_audio_spectrum = on_audio_spectrum
 
         self._stream: Optional[sd.InputStream] = None
-        self._audio_buffer: List[np.ndarray] = []
+        self._audio_buffer: Optional[np.ndarray] = None
+        self._write_pos = 0
+        self._meter_scratch: Optional[np.ndarray] = None
+        self._frames_until_meter = 0
         self._is_recording = False
         self._device_sample_rate: Optional[float] = None
         self._spectrum_frames: Optional[int] = None
@@ -48,7 +69,11 @@ class AudioRecorder:
         if self._is_recording:
             return True
 
-        self._audio_buffer = []
+        self._audio_buffer = np.empty(
+            (self.sample_rate * BUFFER_SECONDS, self.channels), dtype=CAPTURE_DTYPE
+        )
+        self._write_pos = 0
+        self._frames_until_meter = 0
         self._last_error: Optional[str] = None
 
         try:
@@ -58,6 +83,7 @@ class AudioRecorder:
             self._stream = sd.InputStream(
                 samplerate=self._device_sample_rate,
                 channels=self.channels,
+                dtype=np.dtype(CAPTURE_DTYPE).name,
                 device=self._get_device_index(),
                 callback=self._audio_callback,
             )
@@ -97,34 +123,60 @@ class AudioRecorder:
             self._stream.close()
             self._stream = None
 
-        if not self._audio_buffer:
+        audio_buffer, self._audio_buffer = self._audio_buffer, None
+        if audio_buffer is None or self._write_pos == 0:
             return None
 
-        audio_data = np.concatenate(self._audio_buffer, axis=0)
-
-        return audio_data
+        # The filled prefix is returned as a view; the recorder drops its own
+        # reference so the next start() cannot overwrite it.
+        return audio_buffer[: self._write_pos]
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time, status) -> None:
         if self._is_recording:
-            self._audio_buffer.append(indata.copy())
+            self._append(indata)
 
-            if self.on_audio_level is not None:
-                level = np.abs(indata).mean()
-                self.on_audio_level(min(1.0, level * 10))
+            if self._frames_until_meter > 0:
+                self._frames_until_meter -= indata.shape[0]
+                return
+            self._frames_until_meter = (
+                int(self.sample_rate * METER_INTERVAL_SECONDS) - indata.shape[0]
+            )
+
+            if self.on_audio_level is None and self.on_audio_spectrum is None:
+                return
+
+            # Meters work on [-1, 1] floats; scale into a reused scratch block
+            samples = self._meter_scratch
+            if samples is None or samples.shape != indata.shape:
+                samples = self._meter_scratch = np.empty(indata.shape, np.float32)
+            np.multiply(indata, INT16_SCALE, out=samples)
 
             if self.on_audio_spectrum is not None and self._device_sample_rate:
-                bands = self._compute_spectrum_bands(indata, self._device_sample_rate)
+                bands = self._compute_spectrum_bands(samples, self._device_sample_rate)
                 self.on_audio_spectrum(bands)
 
+            if self.on_audio_level is not None:
+                level = np.abs(samples, out=samples).mean()
+                self.on_audio_level(min(1.0, level * 10))
+
+    def _append(self, indata: np.ndarray) -> None:
+        end = self._write_pos + indata.shape[0]
+        if end > self._audio_buffer.shape[0]:
+            grown = np.empty(
+                (max(end, 2 * self._audio_buffer.shape[0]), self.channels),
+                dtype=CAPTURE_DTYPE,
+            )
+            grown[: self._write_pos] = self._audio_buffer[: self._write_pos]
+            self._audio_buffer = grown
+        self._audio_buffer[self._write_pos : end] = indata
+        self._write_pos = end
+
     def _get_device_index(self) -> Optional[int]:
         if self.device is None:
             return None
 
-        for device in self.list_devices():
-            if device.name == self.device:
-                return device.index
-
-        return None
+        ttl_bucket = int(time.monotonic() // DEVICE_CACHE_SECONDS)
+        return _input_device_indices(ttl_bucket).get(self.device)
 
     def _compute_spectrum_bands(
         self, indata: np.ndarray, sample_rate: float
@@ -208,3 +260,12 @@ class AudioRecorder:
                 )
 
         return devices
+
+
+@functools.lru_cache(maxsize=1)
+def _input_device_indices(ttl_bucket: int) -> Dict[str, int]:
+    # ttl_bucket only varies the cache key so the snapshot expires
+    indices: Dict[str, int] = {}
+    for device in AudioRecorder.list_devices():
+        indices.setdefault(device.name, device.index)
+    return indices
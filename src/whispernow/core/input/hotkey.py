@@ -4,7 +4,9 @@ Hotkey listener for global keyboard shortcuts.
 Uses pynput for Windows and Linux.
 """
 
-from typing import Optional, Set
+import threading
+from collections import deque
+from typing import Iterable, Optional, Set
 
 from PySide6.QtCore import QObject, Signal
 
@@ -13,6 +15,32 @@ from ..settings.settings import Settings, get_settings
 
 logger = get_logger(__name__)
 
+# Held modifiers are tracked as a bitmask: each pynput Key gets its own bit,
+# with the left/right variants of a modifier in adjacent bits (left first).
+_MODIFIER_KEY_BITS = {
+    "ctrl_l": 1 << 0,
+    "ctrl_r": 1 << 1,
+    "alt_l": 1 << 2,
+    "alt_r": 1 << 3,
+    "shift_l": 1 << 4,
+    "shift_r": 1 << 5,
+    "cmd_l": 1 << 6,
+    "cmd_r": 1 << 7,
+}
+_LEFT_KEY_BITS = 0b01010101
+
+# Modifier settings map to the bit of their left key; folding the right-key
+# bits onto it (see _check_hotkey) makes either side satisfy the modifier.
+_MODIFIER_BITS = {
+    "ctrl": 1 << 0,
+    "alt": 1 << 2,
+    "shift": 1 << 4,
+    "cmd": 1 << 6,
+    "meta": 1 << 6,
+}
+# Never set by a key, so an unknown modifier setting can never be satisfied
+_UNKNOWN_MODIFIER_BIT = 1 << 8
+
 
 class HotkeyListener(QObject):
     """
@@ -71,10 +99,21 @@ class _PynputHotkeyListenerImpl:
 
         self._listener = listener
         self._keyboard_listener: Optional[keyboard.Listener] = None
-        self._pressed_keys: set = set()
+        self._key_bits = {
+            getattr(keyboard.Key, name): bit for name, bit in _MODIFIER_KEY_BITS.items()
+        }
+        self._held_mask = 0
+        self._trigger_held = False
+        # (is_press, key) events queued by the pynput hook for _dispatch_loop
+        self._events: deque = deque()
+        self._wake = threading.Event()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._running = False
 
         self._trigger_key = keyboard.Key.space
         self._required_modifier_types = listener._required_modifier_types
+        self._required_mask = 0
+        self._update_required_mask(listener._required_modifier_types)
         self._update_trigger_key(listener._trigger_key)
 
     def _update_trigger_key(self, key_name: str) -> None:
@@ -87,63 +126,79 @@ class _PynputHotkeyListenerImpl:
                 self._trigger_key = keyboard.KeyCode.from_char(key_name)
         else:
             self._trigger_key = keyboard.Key.space
+        self._trigger_held = False
+
+    def _update_required_mask(self, modifiers: Iterable[str]) -> None:
+        mask = 0
+        for mod_type in modifiers:
+            mask |= _MODIFIER_BITS.get(mod_type, _UNKNOWN_MODIFIER_BIT)
+        self._required_mask = mask
 
     def update_config(self, trigger_key: str, modifiers: Set[str]) -> None:
         self._required_modifier_types = modifiers
+        self._update_required_mask(modifiers)
         self._update_trigger_key(trigger_key)
 
     def _check_hotkey(self) -> bool:
-        from pynput import keyboard
-
-        if self._trigger_key not in self._pressed_keys:
-            return False
-
-        for mod_type in self._required_modifier_types:
-            is_pressed = False
-            if mod_type == "ctrl":
-                is_pressed = (
-                    keyboard.Key.ctrl_l in self._pressed_keys
-                    or keyboard.Key.ctrl_r in self._pressed_keys
-                )
-            elif mod_type == "alt":
-                is_pressed = (
-                    keyboard.Key.alt_l in self._pressed_keys
-                    or keyboard.Key.alt_r in self._pressed_keys
-                )
-            elif mod_type == "shift":
-                is_pressed = (
-                    keyboard.Key.shift_l in self._pressed_keys
-                    or keyboard.Key.shift_r in self._pressed_keys
-                )
-            elif mod_type in ("cmd", "meta"):
-                is_pressed = (
-                    keyboard.Key.cmd_l in self._pressed_keys
-                    or keyboard.Key.cmd_r in self._pressed_keys
-                )
+        held = (self._held_mask | (self._held_mask >> 1)) & _LEFT_KEY_BITS
+        required = self._required_mask
+        return self._trigger_held and held & required == required
 
-            if not is_pressed:
-                return False
-
-        return True
+    def _is_hotkey_key(self, key) -> bool:
+        return key in self._key_bits or key == self._trigger_key
 
     def _on_press(self, key) -> None:
-        self._pressed_keys.add(key)
-
-        if self._check_hotkey():
-            self._listener._on_hotkey_pressed()
+        # Runs inside the OS input hook: queue the event and return at once,
+        # since any work here delays keyboard input system-wide. Keys that are
+        # neither a modifier nor the trigger cannot change the hotkey state.
+        if self._is_hotkey_key(key):
+            self._events.append((True, key))
+            self._wake.set()
 
     def _on_release(self, key) -> None:
-        try:
-            self._pressed_keys.remove(key)
-        except KeyError:
-            pass
-
-        if not self._check_hotkey():
-            self._listener._on_hotkey_released()
+        if self._is_hotkey_key(key):
+            self._events.append((False, key))
+            self._wake.set()
+
+    def _handle_event(self, is_press: bool, key) -> None:
+        bit = self._key_bits.get(key, 0)
+        is_trigger = key == self._trigger_key
+        if is_press:
+            self._held_mask |= bit
+            self._trigger_held |= is_trigger
+            if self._check_hotkey():
+                self._listener._on_hotkey_pressed()
+        else:
+            self._held_mask &= ~bit
+            if is_trigger:
+                self._trigger_held = False
+            if not self._check_hotkey():
+                self._listener._on_hotkey_released()
+
+    def _dispatch_loop(self) -> None:
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            while self._events:
+                is_press, key = self._events.popleft()
+                try:
+                    self._handle_event(is_press, key)
+                except Exception as e:
+                    logger.error(f"Hotkey event handling failed: {e}")
 
     def start(self) -> None:
         from pynput import keyboard
 
+        # A second dispatch thread would race the first for queued events
+        if self._dispatch_thread is not None and self._dispatch_thread.is_alive():
+            return
+
+        self._running = True
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, name="hotkey-dispatch", daemon=True
+        )
+        self._dispatch_thread.start()
+
         self._keyboard_listener = keyboard.Listener(
             on_press=self._on_press, on_release=self._on_release
         )
@@ -162,3 +217,9 @@ class _PynputHotkeyListenerImpl:
         if self._keyboard_listener:
             self._keyboard_listener.stop()
             self._keyboard_listener = None
+
+        if self._dispatch_thread is not None:
+            self._running = False
+            self._wake.set()
+            self._dispatch_thread.join(timeout=1.0)
+            self._dispatch_thread = None
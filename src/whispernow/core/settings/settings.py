@@ -1,9 +1,19 @@
-import json
+import functools
+import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from platformdirs import user_config_path, user_data_path
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+from pydantic_core import from_json, to_json
 
 from ...utils.logger import get_logger
 
@@ -20,14 +30,26 @@ def _get_default_enhancements() -> List[dict]:
     return [e.model_dump() for e in get_default_enhancements()]
 
 
+# Resolved and created once per process; every save and history update
+# otherwise repeats the platform lookup and a mkdir syscall.
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     return user_config_path(APP_NAME, appauthor=False, ensure_exists=True)
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     return user_data_path(APP_NAME, appauthor=False, ensure_exists=True)
 
 
+def _write_atomic(path: Path, payload: bytes) -> None:
+    # Write a sibling file and rename it over the target, so a crash mid-write
+    # never leaves a truncated settings or history file behind.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
 class HotkeyConfig(BaseModel):
     model_config = ConfigDict(validate_assignment=False)
 
@@ -122,12 +144,12 @@ class Settings(BaseModel):
 
         if config_file.exists():
             try:
-                with open(config_file, "r") as f:
-                    data = json.load(f)
+                data = from_json(config_file.read_bytes())
 
                 # Filter to valid keys only
-                valid_keys = cls.model_fields.keys()
-                filtered_data = {k: v for k, v in data.items() if k in valid_keys}
+                filtered_data = {
+                    k: v for k, v in data.items() if k in _SETTINGS_FIELD_NAMES
+                }
 
                 # Handle nested HotkeyConfig
                 if "hotkey" in filtered_data and isinstance(
@@ -173,7 +195,7 @@ class Settings(BaseModel):
                     settings.enhancements = _get_default_enhancements()
 
                 return settings
-            except (json.JSONDecodeError, TypeError) as e:
+            except (ValueError, TypeError) as e:
                 logger.warning(
                     f"Could not load settings: {e}. Using defaults.", exc_info=True
                 )
@@ -185,7 +207,15 @@ class Settings(BaseModel):
 
     @classmethod
     def _load_with_fallbacks(cls, data: dict) -> "Settings":
+        # A valid file, the usual case, needs one compiled validation pass;
+        # only fall back to checking fields one by one if that fails.
+        try:
+            return cls.model_validate(data)
+        except ValidationError:
+            pass
+
         defaults = cls()
+        default_data = defaults.model_dump()
         result_data = {}
 
         for field_name, field_info in cls.model_fields.items():
@@ -199,7 +229,7 @@ class Settings(BaseModel):
                     ):
                         result_data[field_name] = data[field_name]
                     else:
-                        cls.model_validate({**defaults.model_dump(), **test_data})
+                        cls.model_validate({**default_data, **test_data})
                         result_data[field_name] = data[field_name]
                 except Exception as e:
                     default_val = getattr(defaults, field_name)
@@ -215,15 +245,12 @@ class Settings(BaseModel):
     def save(self) -> None:
         config_file = get_config_dir() / "settings.json"
 
-        data = self.model_dump()
-
-        with open(config_file, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_atomic(config_file, to_json(self, indent=2))
 
     def reset_to_defaults(self) -> None:
-        default = Settings()
-        for key, value in default.model_dump().items():
-            setattr(self, key, value)
+        # Take the fresh instance's field values as-is, so nested models stay
+        # models instead of the dicts model_dump() would produce.
+        self.__dict__.update(Settings().__dict__)
 
     def get_active_enhancement(self) -> Optional["Enhancement"]:
         if not self.active_enhancement_id:
@@ -279,13 +306,22 @@ class Settings(BaseModel):
         self.set_provider_settings(self.llm_provider, provider_settings)
 
 
+_SETTINGS_FIELD_NAMES = frozenset(Settings.model_fields)
+
 _settings_instance: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+# Parses and serialises the whole history list in one pass over the JSON bytes
+_history_adapter = TypeAdapter(List[TranscriptionRecord])
 
 
 def get_settings() -> Settings:
     global _settings_instance
     if _settings_instance is None:
-        _settings_instance = Settings.load()
+        # Double-checked so concurrent first callers share one load
+        with _settings_lock:
+            if _settings_instance is None:
+                _settings_instance = Settings.load()
     return _settings_instance
 
 
@@ -300,12 +336,8 @@ def load_history() -> List[TranscriptionRecord]:
         return []
 
     try:
-        with open(history_file, "r") as f:
-            data = json.load(f)
-
-        records = [TranscriptionRecord.from_dict(item) for item in data]
-        return records
-    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        return _history_adapter.validate_json(history_file.read_bytes())
+    except (ValueError, TypeError, KeyError) as e:
         logger.warning(f"Could not load history: {e}. Starting fresh.")
         return []
 
@@ -314,10 +346,7 @@ def save_history(records: List[TranscriptionRecord]) -> None:
     history_file = get_history_file()
     records = records[-MAX_HISTORY_ENTRIES:]
 
-    data = [record.to_dict() for record in records]
-
-    with open(history_file, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_atomic(history_file, _history_adapter.dump_json(records, indent=2))
 
 
 def add_history_record(record: TranscriptionRecord) -> None:
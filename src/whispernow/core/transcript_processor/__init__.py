@@ -5,6 +5,7 @@ from .llm_processor import (
     LLMProcessor,
     LLMResponse,
     get_models_for_provider,
+    preload_litellm,
 )
 from .vocabulary_processor import apply_vocabulary_replacements
 
@@ -15,5 +16,6 @@ __all__ = [
     "PROVIDERS",
     "DEFAULT_ENHANCEMENTS",
     "get_models_for_provider",
+    "preload_litellm",
     "apply_vocabulary_replacements",
 ]
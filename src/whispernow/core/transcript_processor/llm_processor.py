@@ -1,10 +1,11 @@
+import functools
 import os
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import litellm
-from litellm import completion, completion_cost
 from pydantic import BaseModel, ConfigDict
 
 from ...utils.logger import get_logger
@@ -12,6 +13,50 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# litellm takes seconds to import, so it is only loaded once an LLM feature is
+# actually used rather than whenever the transcription pipeline is imported.
+_litellm = None
+_litellm_lock = threading.Lock()
+
+
+def _import_litellm():
+    global _litellm
+    if _litellm is None:
+        # The background preload and a GUI-thread caller may both get here
+        with _litellm_lock:
+            if _litellm is None:
+                import litellm
+
+                _litellm = litellm
+    return _litellm
+
+
+def _model_cost() -> dict:
+    return _import_litellm().model_cost
+
+
+def preload_litellm() -> None:
+    """Import litellm on a daemon thread so the first enhancement doesn't wait on it."""
+    if _litellm is not None:
+        return
+    threading.Thread(
+        target=_import_litellm, name="litellm-preload", daemon=True
+    ).start()
+
+
+def completion(**kwargs):
+    return _import_litellm().completion(**kwargs)
+
+
+def completion_cost(**kwargs) -> float:
+    return _import_litellm().completion_cost(**kwargs)
+
+
+# Enhanced results remembered per processor, so re-dictating the same text with
+# the same prompt skips the network round-trip. Long texts are not cached.
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_MAX_CHARS = 4096
+
 PROVIDERS: Dict[str, tuple] = {
     "openai": ("OpenAI", None, "OPENAI_API_KEY"),
     "anthropic": ("Anthropic", None, "ANTHROPIC_API_KEY"),
@@ -22,83 +67,86 @@ PROVIDERS: Dict[str, tuple] = {
 }
 
 
+def _provider_of(model: str) -> Optional[str]:
+    if "/" not in model:
+        if model.startswith(("gpt-", "o1-", "o3-", "chatgpt-")):
+            # OpenAI models: gpt-*, o1-*, o3-*, chatgpt-*
+            return "openai"
+        if model.startswith("claude-"):
+            return "anthropic"
+        if model.startswith("gemini-"):
+            return "gemini"
+    elif model.startswith("gemini/"):
+        return "gemini"
+    elif model.startswith("ollama/"):
+        return "ollama"
+    elif model.startswith("openrouter/"):
+        return "openrouter"
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _provider_model_index(model_count: int) -> Dict[str, List[str]]:
+    # Keyed on the size of litellm's model map so models registered at
+    # runtime rebuild the index instead of serving a stale one.
+    index: Dict[str, List[str]] = {}
+    for model in _model_cost():
+        provider = _provider_of(model)
+        if provider is not None:
+            index.setdefault(provider, []).append(model)
+    return {provider: sorted(models)[:100] for provider, models in index.items()}
+
+
 def get_models_for_provider(provider: str) -> List[str]:
     """Get models for provider. Dropdown is editable so users can type custom names."""
     if provider == "other":
         return []  # User will type custom model name
 
     try:
-        all_models = list(litellm.model_cost.keys())
-
-        if provider == "openai":
-            # OpenAI models: gpt-*, o1-*, o3-*, chatgpt-*
-            filtered = [
-                m
-                for m in all_models
-                if m.startswith(("gpt-", "o1-", "o3-", "chatgpt-")) and "/" not in m
-            ]
-        elif provider == "anthropic":
-            filtered = [
-                m for m in all_models if m.startswith("claude-") and "/" not in m
-            ]
-        elif provider == "gemini":
-            filtered = [
-                m
-                for m in all_models
-                if m.startswith("gemini/") or (m.startswith("gemini-") and "/" not in m)
-            ]
-        elif provider == "ollama":
-            filtered = [m for m in all_models if m.startswith("ollama/")]
-        elif provider == "openrouter":
-            filtered = [m for m in all_models if m.startswith("openrouter/")]
-        else:
-            filtered = []
-
-        result = sorted(filtered)[:100]
-        return result if result else _get_fallback_models(provider)
+        result = _provider_model_index(len(_model_cost())).get(provider)
+        return list(result) if result else _get_fallback_models(provider)
 
     except Exception as e:
         logger.warning(f"Failed to get models for provider {provider}: {e}")
         return _get_fallback_models(provider)
 
 
-from typing import List
+_FALLBACK_MODELS: Dict[str, Tuple[str, ...]] = {
+    "openai": (
+        "gpt-5.2",
+        "gpt-5-nano",
+        "gpt-4o",
+        "o3",
+        "o4-mini",
+    ),
+    "anthropic": (
+        "claude-sonnet-4-5-20250929",
+        "claude-opus-4-5-20251101",
+        "claude-haiku-4-5-20251001",
+        "claude-3-5-sonnet-20241022",
+    ),
+    "openrouter": (
+        "openrouter/auto",
+        "openrouter/openai/gpt-5.2",
+        "openrouter/anthropic/claude-sonnet-4.5",
+        "openrouter/google/gemini-3-flash",
+    ),
+    "ollama": (
+        "ollama/llama3.3",
+        "ollama/gemma3",
+        "ollama/mistral",
+        "ollama/phi4",
+    ),
+    "gemini": (
+        "gemini/gemini-3-flash",
+        "gemini/gemini-3-pro",
+        "gemini/gemini-2.5-flash",
+    ),
+}
 
 
 def _get_fallback_models(provider: str) -> List[str]:
-    models = {
-        "openai": [
-            "gpt-5.2",
-            "gpt-5-nano",
-            "gpt-4o",
-            "o3",
-            "o4-mini",
-        ],
-        "anthropic": [
-            "claude-sonnet-4-5-20250929",
-            "claude-opus-4-5-20251101",
-            "claude-haiku-4-5-20251001",
-            "claude-3-5-sonnet-20241022",
-        ],
-        "openrouter": [
-            "openrouter/auto",
-            "openrouter/openai/gpt-5.2",
-            "openrouter/anthropic/claude-sonnet-4.5",
-            "openrouter/google/gemini-3-flash",
-        ],
-        "ollama": [
-            "ollama/llama3.3",
-            "ollama/gemma3",
-            "ollama/mistral",
-            "ollama/phi4",
-        ],
-        "gemini": [
-            "gemini/gemini-3-flash",
-            "gemini/gemini-3-pro",
-            "gemini/gemini-2.5-flash",
-        ],
-    }
-    return models.get(provider, [])
+    return list(_FALLBACK_MODELS.get(provider, ()))
 
 
 class Enhancement(BaseModel):
@@ -163,25 +211,39 @@ class LLMProcessor:
         self.model = model
         self.api_key = api_key
         self.api_base = api_base
+        self._result_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # One processor is shared by overlapping transcription worker threads
+        self._result_cache_lock = threading.Lock()
 
-        model_info = litellm.model_cost.get(model, {})
-        self._supports_system_messages = model_info.get(
-            "supports_system_messages", True
+        logger.info(
+            f"LLMProcessor initialized with model: {model}, api_base: {api_base}"
         )
 
-        if not self._supports_system_messages:
+    @functools.cached_property
+    def _supports_system_messages(self) -> bool:
+        # Looked up on first use so constructing a processor on the UI thread
+        # never waits for litellm to import.
+        model_info = _model_cost().get(self.model, {})
+        supported = model_info.get("supports_system_messages", True)
+        if not supported:
             logger.info(
-                f"Model {model} does not support system messages (per model_cost)"
+                f"Model {self.model} does not support system messages (per model_cost)"
             )
-
-        logger.info(
-            f"LLMProcessor initialized with model: {model}, api_base: {api_base}"
-        )
+        return supported
 
     def process(self, text: str, enhancement: Enhancement) -> LLMResponse:
         if not text or not text.strip():
             return LLMResponse(content=text)
 
+        cache_key = (enhancement.prompt, text)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached result for enhancement '{enhancement.title}'")
+            return LLMResponse(content=cached)
+
         logger.info(
             f"Applying enhancement '{enhancement.title}' to text ({len(text)} chars)"
         )
@@ -236,6 +298,12 @@ class LLMProcessor:
                 else f"Enhancement complete: {len(text)} -> {len(result_text)} chars"
             )
 
+            if result_text and len(text) <= RESULT_CACHE_MAX_CHARS:
+                with self._result_cache_lock:
+                    self._result_cache[cache_key] = result_text
+                    while len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+
             return LLMResponse(content=result_text, cost_usd=cost, usage=usage)
 
         except Exception as e:
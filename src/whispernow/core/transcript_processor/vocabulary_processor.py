@@ -1,21 +1,89 @@
 """Vocabulary replacement processor."""
 
+import functools
 import re
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _trie_pattern(keys) -> str:
+    """Regex matching any of ``keys``, preferring the longest at each position.
+
+    A flat alternation makes the regex engine try every rule at every
+    character; factoring the keys into a prefix trie means each position only
+    follows the branches that share its prefix, like an Aho-Corasick scan.
+    """
+    trie: dict = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = []
+        for char, child in sorted(node.items()):
+            if not char:
+                continue
+            # Collapse single-child chains so nesting only grows at branch points
+            literal = char
+            while len(child) == 1 and "" not in child:
+                ((char, child),) = child.items()
+                literal += char
+            branches.append(re.escape(literal) + build(child))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Greedy: try the longer continuations before ending the match here
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_replacements(
+    replacements: Tuple[Tuple[str, str], ...], case_sensitive: bool
+) -> Tuple[Optional[re.Pattern], Dict[str, str], Optional[Dict[int, str]]]:
+    rules: Dict[str, str] = {}
+    for original, replacement in replacements:
+        key = original if case_sensitive else original.lower()
+        if key and key not in rules:
+            rules[key] = replacement
+
+    if not rules:
+        return None, rules, None
+
+    # Character-level rules (punctuation, diacritics) need no regex at all:
+    # str.translate does them in one C-level pass. Only taken when every rule
+    # is a single character, so it cannot shadow a longer rule.
+    if all(len(key) == 1 for key in rules) and (
+        case_sensitive or all(key.upper() == key for key in rules)
+    ):
+        return None, rules, str.maketrans(rules)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        pattern = re.compile(_trie_pattern(rules), flags)
+    except RecursionError:
+        # Deeply nested rule sets (many rules prefixing each other): fall back
+        # to a longest-first alternation, which matches the same text.
+        alternation = "|".join(map(re.escape, sorted(rules, key=len, reverse=True)))
+        pattern = re.compile(alternation, flags)
+    return pattern, rules, None
+
+
 def apply_vocabulary_replacements(
     text: str, replacements: List[Tuple[str, str]], case_sensitive: bool = True
 ) -> str:
     """
     Apply vocabulary replacements to text.
 
-    Replaces all occurrences of 'original' with 'replacement' for each rule.
-    Processes rules in order they were defined.
+    Replaces all occurrences of 'original' with 'replacement' in a single
+    scan over the text. When several rules match at the same position, the
+    longest one wins; replaced text is not matched again.
 
     Args:
         text: The input transcription text
@@ -28,17 +96,19 @@ def apply_vocabulary_replacements(
     if not replacements:
         return text
 
-    result = text
-    for original, replacement in replacements:
-        if not original:
-            continue
-
-        if case_sensitive:
-            result = result.replace(original, replacement)
-        else:
-            result = re.sub(
-                re.escape(original), replacement, result, flags=re.IGNORECASE
-            )
+    pattern, rules, table = _compile_replacements(
+        tuple(map(tuple, replacements)), case_sensitive
+    )
+    if table is not None:
+        result = text.translate(table)
+    elif pattern is None:
+        return text
+    elif case_sensitive:
+        result = pattern.sub(lambda match: rules[match.group()], text)
+    else:
+        result = pattern.sub(
+            lambda match: rules.get(match.group().lower(), match.group()), text
+        )
 
     if result != text:
         logger.debug(
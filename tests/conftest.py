@@ -1,8 +1,14 @@
 """Pytest configuration for Qt-based tests."""
 
+import os
+
 import pytest
 from PySide6.QtWidgets import QApplication
 
+# Tests run offline: use litellm's bundled model-cost map instead of letting
+# its import fetch (and retry in a background thread) the remote one.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
 
 @pytest.fixture(autouse=True)
 def cleanup_qt_objects(qtbot, request):
@@ -8,6 +8,8 @@ from src.whispernow.core.audio.audio_processor import (
     AudioChunkInfo,
     AudioPreview,
     AudioProcessor,
+    _block_mean,
+    _moving_average,
     needs_chunking,
 )
 
@@ -128,6 +130,53 @@ class TestAudioProcessorSplitting:
         # Should create multiple chunks
         assert len(chunks) >= 2
 
+    def test_int16_input_matches_float_input(self):
+        processor = AudioProcessor(
+            max_duration=5.0, min_chunk_duration=1.0, silence_threshold=0.1
+        )
+        sample_rate = 16000
+
+        loud = np.sin(np.linspace(0, 1000, 3 * sample_rate)) * 0.5
+        silence = np.zeros(sample_rate, dtype=np.float64)
+        audio_float = np.concatenate([loud, silence, loud, silence, loud])
+        audio_int16 = (audio_float * 32767).astype(np.int16)
+        audio_int16[0] = -32768
+
+        int_points = processor._find_split_points(audio_int16, sample_rate)
+        float_points = processor._find_split_points(
+            audio_int16.astype(np.float32) / 32768.0, sample_rate
+        )
+
+        assert int_points
+        assert int_points == float_points
+
+    def test_find_best_silence_returns_quiet_region_center(self):
+        processor = AudioProcessor(silence_threshold=0.1)
+        sample_rate = 16000
+        silence_samples = int(0.3 * sample_rate)
+
+        audio_smooth = np.full(10 * sample_rate, 0.5, dtype=np.float32)
+        audio_smooth[4 * sample_rate : 5 * sample_rate] = 0.0
+
+        best = processor._find_best_silence(
+            audio_smooth, 0, len(audio_smooth), silence_samples, sample_rate
+        )
+
+        assert best is not None
+        assert 4 * sample_rate <= best - silence_samples // 2
+        assert best + silence_samples // 2 <= 5 * sample_rate
+
+    def test_find_best_silence_none_without_silence(self):
+        processor = AudioProcessor(silence_threshold=0.1)
+        sample_rate = 16000
+        audio_smooth = np.full(10 * sample_rate, 0.5, dtype=np.float32)
+
+        best = processor._find_best_silence(
+            audio_smooth, 0, len(audio_smooth), int(0.3 * sample_rate), sample_rate
+        )
+
+        assert best is None
+
     def test_fallback_to_time_based_splitting(self):
         processor = AudioProcessor(
             max_duration=5.0,
@@ -147,6 +196,33 @@ class TestAudioProcessorSplitting:
         assert len(chunks) >= 2
 
 
+class TestMovingAverage:
+    @pytest.mark.parametrize("length,window_size", [(100, 10), (101, 7), (50, 49)])
+    def test_matches_convolve_same(self, length, window_size):
+        rng = np.random.default_rng(0)
+        values = np.abs(rng.standard_normal(length)).astype(np.float32)
+
+        expected = np.convolve(values, np.ones(window_size) / window_size, mode="same")
+        result = _moving_average(values, window_size)
+
+        assert result.shape == values.shape
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+
+class TestBlockMean:
+    @pytest.mark.parametrize("length,block_size", [(12, 2), (13, 3), (5, 6)])
+    def test_matches_per_block_mean(self, length, block_size):
+        values = np.arange(length, dtype=np.uint16)
+
+        expected = [
+            values[i : i + block_size].mean() for i in range(0, length, block_size)
+        ]
+        result = _block_mean(values, block_size)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
 class TestAudioProcessorPreview:
     def test_preview_short_audio(self):
         processor = AudioProcessor()
@@ -199,6 +275,13 @@ class TestTranscriptionCombining:
 
         assert result == "Hello world"
 
+    def test_combine_collapses_tabs_and_newlines(self):
+        processor = AudioProcessor()
+
+        result = processor.combine_transcriptions(["Hello \n world", "again\t\tnow"])
+
+        assert result == "Hello world again now"
+
     def test_combine_empty_list(self):
         processor = AudioProcessor()
 
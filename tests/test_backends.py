@@ -71,3 +71,75 @@ def test_is_model_cached_transducer():
 
         assert backend.is_model_cached("test-transducer") is True
         mock_valid.assert_called_once()
+
+
+def test_transcribe_batch_decodes_streams_together():
+    from unittest.mock import MagicMock
+
+    import numpy as np
+
+    from src.whispernow.core.asr.backends import SherpaOnnxBackend
+
+    backend = SherpaOnnxBackend()
+    recognizer = MagicMock()
+    streams = [MagicMock(), MagicMock()]
+    streams[0].result = MagicMock(text="first", timestamps=[], tokens=[])
+    streams[1].result = MagicMock(text="second", timestamps=[], tokens=[])
+    recognizer.create_stream.side_effect = streams
+    backend._recognizer = recognizer
+
+    chunks = [np.zeros(1600, dtype=np.int16), np.zeros(3200, dtype=np.float32)]
+    results = backend.transcribe_batch(chunks, 16000)
+
+    assert [r.text for r in results] == ["first", "second"]
+    recognizer.decode_streams.assert_called_once_with(streams)
+    recognizer.decode_stream.assert_not_called()
+
+
+def test_load_prefers_int8_weights_when_available(tmp_path):
+    from unittest.mock import MagicMock
+
+    from src.whispernow.core.asr.backends import SherpaOnnxBackend
+
+    for name in ("tiny-encoder.onnx", "tiny-encoder.int8.onnx"):
+        (tmp_path / name).touch()
+    for name in ("tiny-decoder.onnx", "tiny-tokens.txt"):
+        (tmp_path / name).touch()
+
+    sherpa = MagicMock()
+    SherpaOnnxBackend()._load_whisper_model(sherpa, str(tmp_path), "int8")
+
+    kwargs = sherpa.OfflineRecognizer.from_whisper.call_args.kwargs
+    assert kwargs["encoder"] == str(tmp_path / "tiny-encoder.int8.onnx")
+    assert kwargs["decoder"] == str(tmp_path / "tiny-decoder.onnx")
+
+
+def test_to_mono_float32_audio_takes_first_channel_contiguously():
+    import numpy as np
+
+    from src.whispernow.core.asr.backends import to_mono_float32_audio
+
+    stereo = np.array([[16384, -32768], [-16384, 0]], dtype=np.int16)
+    mono = to_mono_float32_audio(stereo)
+
+    assert mono.dtype == np.float32
+    assert mono.flags.c_contiguous
+    np.testing.assert_array_equal(mono, [0.5, -0.5])
+
+
+def test_model_dir_validity_checks(tmp_path):
+    from src.whispernow.core.asr.file_utils import (
+        is_valid_model_dir,
+        is_valid_transducer_model,
+        is_valid_whisper_model,
+    )
+
+    for name in ("encoder.int8.onnx", "decoder.onnx", "tokens.txt"):
+        (tmp_path / name).touch()
+    assert is_valid_model_dir(str(tmp_path))
+    assert not is_valid_transducer_model(str(tmp_path))
+    assert not is_valid_whisper_model(str(tmp_path))
+
+    (tmp_path / "joiner.fp16.onnx").touch()
+    assert is_valid_transducer_model(str(tmp_path))
+    assert not is_valid_transducer_model(str(tmp_path / "missing"))
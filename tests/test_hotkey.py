@@ -0,0 +1,27 @@
+"""Tests for the global hotkey listener."""
+
+from unittest.mock import patch
+
+from src.whispernow.core.input.hotkey import HotkeyListener
+from src.whispernow.core.settings import Settings
+
+
+class TestHotkeyListenerLifecycle:
+    @patch("pynput.keyboard.Listener")
+    @patch("src.whispernow.core.input.hotkey.get_settings", return_value=Settings())
+    def test_double_start_runs_one_dispatch_thread(self, _, MockListener):
+        listener = HotkeyListener()
+        impl = listener._impl
+
+        listener.start()
+        dispatch_thread = impl._dispatch_thread
+        listener.start()
+
+        assert impl._dispatch_thread is dispatch_thread
+        MockListener.assert_called_once()
+
+        listener.stop()
+
+        assert not dispatch_thread.is_alive()
+        assert impl._dispatch_thread is None
+        MockListener.return_value.stop.assert_called_once()
@@ -1,5 +1,6 @@
 from unittest.mock import ANY, MagicMock, patch
 
+import numpy as np
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
@@ -52,7 +53,8 @@ def mock_dependencies():
 
         mock_tray = MockTray.return_value
         mock_recorder = MockRecorder.return_value
-        mock_recorder.stop.return_value = b"audio_data"  # Simulate audio captured
+        # Simulate one second of captured audio
+        mock_recorder.stop.return_value = np.zeros(16000, dtype=np.float32)
 
         mock_transcriber = MockTranscriber.return_value
         mock_transcriber.transcribe_chunked.return_value = "Hello World"
@@ -109,6 +111,19 @@ def test_full_transcription_flow(
     ), "Text output was not called with transcribed text"
 
 
+@patch("src.whispernow.app.TranscriptionWorkerThread")
+def test_short_recording_skips_transcription(
+    MockWorkerThread, mock_dependencies, cleanup_app, qtbot
+):
+    mock_dependencies["recorder"].stop.return_value = np.zeros(1600, dtype=np.float32)
+
+    app = cleanup_app(TranscribeApp())
+    app._start_recording()
+    app._stop_recording()
+
+    MockWorkerThread.assert_not_called()
+
+
 def test_settings_hotkey_update(mock_dependencies, cleanup_app, qtbot):
     with patch("src.whispernow.app.HotkeyListener") as MockListener:
         mock_listener_instance = MockListener.return_value
@@ -1,5 +1,8 @@
 """Tests for LLM processor."""
 
+import os
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +12,7 @@ from src.whispernow.core.transcript_processor.llm_processor import (
     Enhancement,
     LLMProcessor,
     LLMResponse,
+    get_models_for_provider,
 )
 
 
@@ -46,6 +50,40 @@ class TestEnhancement:
         assert result == original
 
 
+class TestLitellmImport:
+    @patch("src.whispernow.core.transcript_processor.llm_processor._litellm", None)
+    def test_concurrent_imports_share_one_module(self):
+        from src.whispernow.core.transcript_processor import llm_processor
+
+        fake_litellm = MagicMock()
+        results = []
+        with patch.dict(sys.modules, {"litellm": fake_litellm}):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(llm_processor._import_litellm())
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert results == [fake_litellm] * 4
+        assert llm_processor._litellm is fake_litellm
+
+    @patch("src.whispernow.core.transcript_processor.llm_processor._litellm", None)
+    def test_import_keeps_remote_cost_map_setting(self):
+        from src.whispernow.core.transcript_processor import llm_processor
+
+        with (
+            patch.dict(sys.modules, {"litellm": MagicMock()}),
+            patch.dict(os.environ, clear=True),
+        ):
+            llm_processor._import_litellm()
+            assert "LITELLM_LOCAL_MODEL_COST_MAP" not in os.environ
+
+
 class TestDefaultEnhancements:
     def test_defaults_exist(self):
         assert len(DEFAULT_ENHANCEMENTS) >= 3
@@ -57,6 +95,29 @@ class TestDefaultEnhancements:
             assert enh.prompt
 
 
+class TestGetModelsForProvider:
+    @patch("src.whispernow.core.transcript_processor.llm_processor._model_cost")
+    def test_filters_and_sorts_by_provider(self, mock_model_cost):
+        mock_model_cost.return_value = {
+            "gpt-4o": {},
+            "claude-x": {},
+            "chatgpt-4o-latest": {},
+            "azure/gpt-4o": {},
+            "ollama/llama3": {},
+        }
+        assert get_models_for_provider("openai") == ["chatgpt-4o-latest", "gpt-4o"]
+        assert get_models_for_provider("ollama") == ["ollama/llama3"]
+
+    @patch("src.whispernow.core.transcript_processor.llm_processor._model_cost")
+    def test_picks_up_models_registered_later(self, mock_model_cost):
+        models = {"claude-a": {}}
+        mock_model_cost.return_value = models
+        assert get_models_for_provider("anthropic") == ["claude-a"]
+
+        models["claude-b"] = {}
+        assert get_models_for_provider("anthropic") == ["claude-a", "claude-b"]
+
+
 class TestLLMProcessor:
     def test_initialization(self):
         processor = LLMProcessor(model="gpt-4o-mini", api_key="test-key")
@@ -68,6 +129,11 @@ class TestLLMProcessor:
         assert processor.model == "gpt-5-nano"
         assert processor.api_key is None
 
+    @patch("src.whispernow.core.transcript_processor.llm_processor._model_cost")
+    def test_initialization_does_not_read_model_metadata(self, mock_model_cost):
+        LLMProcessor(model="gpt-4o-mini")
+        mock_model_cost.assert_not_called()
+
     def test_is_configured_with_api_key(self):
         processor = LLMProcessor(api_key="test-key")
         assert processor.is_configured() is True
@@ -120,6 +186,41 @@ class TestLLMProcessor:
         assert isinstance(result, LLMResponse)
         assert result.content == "Original text"
 
+    @patch(
+        "src.whispernow.core.transcript_processor.llm_processor.RESULT_CACHE_SIZE", 1
+    )
+    @patch(
+        "src.whispernow.core.transcript_processor.llm_processor.completion_cost",
+        return_value=0.0,
+    )
+    @patch("src.whispernow.core.transcript_processor.llm_processor.completion")
+    def test_concurrent_process_calls_share_cache(self, mock_completion, _):
+        def respond(**kwargs):
+            response = MagicMock(usage=None)
+            response.choices[0].message.content = kwargs["messages"][1]["content"]
+            return response
+
+        mock_completion.side_effect = respond
+        processor = LLMProcessor(model="gpt-4o-mini", api_key="test-key")
+        enhancement = Enhancement(id="test", title="Test", prompt="Fix the text")
+        texts = ["one", "two", "three"]
+        failures = []
+
+        def worker():
+            for _ in range(50):
+                for text in texts:
+                    if processor.process(text, enhancement).content != text:
+                        failures.append(text)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert failures == []
+        assert len(processor._result_cache) == 1
+
     def test_process_empty_text(self):
         processor = LLMProcessor(model="gpt-4o-mini", api_key="test-key")
         enhancement = Enhancement(id="test", title="Test", prompt="Fix")
@@ -130,3 +231,23 @@ class TestLLMProcessor:
 
         result2 = processor.process("   ", enhancement)
         assert result2.content == "   "
+
+    @patch("src.whispernow.core.transcript_processor.llm_processor.completion")
+    def test_process_reuses_result_for_repeated_text(self, mock_completion):
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Fixed text"
+        mock_response.usage = None
+        mock_completion.return_value = mock_response
+
+        processor = LLMProcessor(model="gpt-4o-mini", api_key="test-key")
+        enhancement = Enhancement(id="test", title="Test", prompt="Fix the text")
+        other = Enhancement(id="test", title="Test", prompt="Shorten the text")
+
+        processor.process("Original text", enhancement)
+        repeated = processor.process("Original text", enhancement)
+        processor.process("Original text", other)
+
+        assert repeated.content == "Fixed text"
+        assert repeated.cost_usd is None
+        assert mock_completion.call_count == 2
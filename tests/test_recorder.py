@@ -5,7 +5,11 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from src.whispernow.core.audio.recorder import AudioDevice, AudioRecorder
+from src.whispernow.core.audio.recorder import (
+    AudioDevice,
+    AudioRecorder,
+    _input_device_indices,
+)
 
 
 class TestAudioDevice:
@@ -83,10 +87,11 @@ class TestAudioRecorderState:
         recorder = AudioRecorder()
         recorder.start()
 
-        recorder._audio_buffer = [
-            np.array([[0.1], [0.2]], dtype=np.float32),
-            np.array([[0.3], [0.4]], dtype=np.float32),
-        ]
+        for block in (
+            np.array([[100], [200]], dtype=np.int16),
+            np.array([[300], [400]], dtype=np.int16),
+        ):
+            recorder._audio_callback(block, len(block), None, None)
 
         audio = recorder.stop()
 
@@ -106,10 +111,9 @@ class TestAudioRecorderState:
 
         # Simulate recorded audio at target sample rate
         chunk_size = 8000  # 0.5 seconds at 16kHz
-        recorder._audio_buffer = [
-            np.zeros((chunk_size, 1), dtype=np.float32),
-            np.zeros((chunk_size, 1), dtype=np.float32),
-        ]
+        for _ in range(2):
+            block = np.zeros((chunk_size, 1), dtype=np.int16)
+            recorder._audio_callback(block, chunk_size, None, None)
 
         audio = recorder.stop()
 
@@ -118,6 +122,22 @@ class TestAudioRecorderState:
         assert len(audio) == expected_samples
         assert recorder.sample_rate == 16000
 
+    @patch("src.whispernow.core.audio.recorder.BUFFER_SECONDS", 1)
+    @patch("src.whispernow.core.audio.recorder.sd.InputStream")
+    def test_buffer_grows_past_initial_capacity(self, mock_stream_class):
+        mock_stream_class.return_value = MagicMock()
+
+        recorder = AudioRecorder(sample_rate=100)
+        recorder.start()
+
+        blocks = [np.full((30, 1), i, dtype=np.int16) for i in range(5)]
+        for block in blocks:
+            recorder._audio_callback(block, len(block), None, None)
+
+        audio = recorder.stop()
+
+        np.testing.assert_array_equal(audio, np.concatenate(blocks))
+
     def test_stop_without_start_returns_none(self):
         recorder = AudioRecorder()
         audio = recorder.stop()
@@ -152,6 +172,25 @@ class TestAudioRecorderConfiguration:
         recorder = AudioRecorder(device="My USB Mic")
         assert recorder.device == "My USB Mic"
 
+    @patch("src.whispernow.core.audio.recorder.sd.query_devices")
+    def test_device_index_lookup_is_cached(self, mock_query):
+        mock_query.return_value = [
+            {"name": "Speakers", "max_input_channels": 0, "default_samplerate": 48000},
+            {
+                "name": "My USB Mic",
+                "max_input_channels": 1,
+                "default_samplerate": 16000,
+            },
+        ]
+        _input_device_indices.cache_clear()
+
+        recorder = AudioRecorder(device="My USB Mic")
+        assert recorder._get_device_index() == 1
+        assert recorder._get_device_index() == 1
+        assert AudioRecorder(device="Missing")._get_device_index() is None
+        assert mock_query.call_count == 1
+        _input_device_indices.cache_clear()
+
 
 class TestAudioCallback:
     @patch("src.whispernow.core.audio.recorder.sd.InputStream")
@@ -167,8 +206,30 @@ class TestAudioCallback:
         recorder = AudioRecorder(on_audio_level=level_callback)
         recorder.start()
 
-        audio_data = np.array([[0.5], [0.5]], dtype=np.float32)
+        audio_data = np.array([[-1638], [1638]], dtype=np.int16)
         recorder._audio_callback(audio_data, 2, None, None)
 
         assert len(levels) == 1
-        assert 0.0 <= levels[0] <= 1.0
+        assert levels[0] == pytest.approx(0.5, abs=1e-3)
+
+    @patch("src.whispernow.core.audio.recorder.sd.InputStream")
+    def test_meters_are_throttled(self, mock_stream_class):
+        mock_stream_class.return_value = MagicMock()
+
+        levels = []
+        spectra = []
+        recorder = AudioRecorder(
+            sample_rate=16000,
+            on_audio_level=levels.append,
+            on_audio_spectrum=spectra.append,
+        )
+        recorder.start()
+
+        # 100 ms of audio in 10 ms blocks; meters update every 25 ms
+        block = np.full((160, 1), 1638, dtype=np.int16)
+        for _ in range(10):
+            recorder._audio_callback(block, len(block), None, None)
+
+        assert len(levels) == 4
+        assert len(spectra) == 4
+        assert recorder.stop().shape == (1600, 1)
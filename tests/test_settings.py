@@ -10,8 +10,11 @@ import pytest
 from src.whispernow.core.settings import (
     HotkeyConfig,
     Settings,
+    TranscriptionRecord,
+    add_history_record,
     get_config_dir,
     get_data_dir,
+    load_history,
 )
 
 
@@ -65,6 +68,17 @@ class TestSettings:
             assert loaded.hotkey.key == "r"
             assert loaded.model_id == "openai/whisper-base"
 
+    def test_save_replaces_file_atomically(self, tmp_path):
+        with patch(
+            "src.whispernow.core.settings.settings.get_config_dir",
+            return_value=tmp_path,
+        ):
+            Settings(sample_rate=44100).save()
+            Settings(sample_rate=48000).save()
+
+            assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+            assert Settings.load().sample_rate == 48000
+
     def test_load_nonexistent_returns_defaults(self, tmp_path):
         config_dir = tmp_path / "empty_config"
         config_dir.mkdir()
@@ -97,11 +111,14 @@ class TestSettings:
         settings = Settings(
             sample_rate=44100,
             model_id="custom/model",
+            hotkey=HotkeyConfig(modifiers=["alt"], key="r"),
         )
         settings.reset_to_defaults()
 
         assert settings.sample_rate == 16000
         assert settings.model_id == "sherpa-onnx-nemo-parakeet-tdt-0.6b-v2-fp16"
+        assert isinstance(settings.hotkey, HotkeyConfig)
+        assert settings.hotkey.to_display_string() == "Ctrl + Space"
 
 
 class TestConfigPaths:
@@ -362,3 +379,32 @@ class TestPerProviderSettings:
             ollama = loaded.get_provider_settings("ollama")
             assert ollama.model == "llama3.2"
             assert ollama.api_base == "http://localhost:11434"
+
+
+class TestHistory:
+    def test_add_and_load_records(self, tmp_path):
+        with patch(
+            "src.whispernow.core.settings.settings.get_config_dir",
+            return_value=tmp_path,
+        ):
+            first = TranscriptionRecord(timestamp="2025-01-01T10:00:00", raw_text="a")
+            second = TranscriptionRecord(
+                timestamp="2025-01-01T10:01:00",
+                raw_text="b",
+                enhanced_text="B.",
+                enhancement_name="Fix",
+                cost_usd=0.001,
+            )
+            add_history_record(first)
+            add_history_record(second)
+
+            assert load_history() == [first, second]
+
+    def test_corrupted_history_starts_fresh(self, tmp_path):
+        (tmp_path / "history.json").write_text('[{"timestamp": 1}')
+
+        with patch(
+            "src.whispernow.core.settings.settings.get_config_dir",
+            return_value=tmp_path,
+        ):
+            assert load_history() == []
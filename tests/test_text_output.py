@@ -0,0 +1,42 @@
+"""Tests for clipboard-based text output."""
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from src.whispernow.core.output.text_output import Key, TextOutputController
+
+
+@pytest.fixture
+def keyboard():
+    with patch(
+        "src.whispernow.core.output.text_output.KeyboardController"
+    ) as MockController:
+        yield MockController.return_value
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("src.whispernow.core.output.text_output.time.sleep"):
+        yield
+
+
+class TestOutputText:
+    @patch("src.whispernow.core.output.text_output.pyperclip")
+    def test_copies_with_pyperclip_then_pastes(self, mock_pyperclip, keyboard):
+        events = MagicMock()
+        events.attach_mock(mock_pyperclip.copy, "copy")
+        events.attach_mock(keyboard.tap, "tap")
+
+        TextOutputController().output_text("Hello world")
+
+        keyboard.pressed.assert_called_once_with(Key.ctrl)
+        assert events.mock_calls == [call.copy("Hello world"), call.tap("v")]
+
+    @patch("src.whispernow.core.output.text_output.pyperclip")
+    def test_clipboard_failure_skips_paste(self, mock_pyperclip, keyboard):
+        mock_pyperclip.copy.side_effect = RuntimeError("no clipboard")
+
+        TextOutputController().output_text("Hello world")
+
+        keyboard.tap.assert_not_called()
@@ -1,8 +1,14 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from src.whispernow.core.asr.transcriber import EngineState, TranscriptionEngine
+from src.whispernow.core.asr.transcriber import (
+    EngineState,
+    TranscriptionEngine,
+    _model_cache_size,
+    clear_backend_cache,
+)
 
 
 class TestEngineState:
@@ -43,6 +49,18 @@ class TestEngineConfiguration:
         assert engine.backend_name == "SHERPA_ONNX"
 
 
+class TestEngineModelCache:
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_is_model_cached_skips_backend_instantiation(self, MockBackend):
+        MockBackend.is_model_cached.return_value = True
+
+        engine = TranscriptionEngine(model_name="test/model")
+
+        assert engine.is_model_cached() is True
+        MockBackend.is_model_cached.assert_called_once_with("test/model")
+        MockBackend.assert_not_called()
+
+
 class TestEngineUnload:
     def test_unload_without_load(self):
         engine = TranscriptionEngine(model_name="test/model")
@@ -50,6 +68,128 @@ class TestEngineUnload:
         assert engine.state == EngineState.NOT_LOADED
 
 
+class TestModelCacheSize:
+    @pytest.mark.parametrize(
+        "value, expected", [("3", 3), ("0", 0), ("-2", 0), ("two", 0), ("", 0)]
+    )
+    def test_parses_env_var_defensively(self, monkeypatch, value, expected):
+        monkeypatch.setenv("WHISPERNOW_MODEL_CACHE", value)
+        assert _model_cache_size() == expected
+
+    def test_defaults_to_disabled(self, monkeypatch):
+        monkeypatch.delenv("WHISPERNOW_MODEL_CACHE", raising=False)
+        assert _model_cache_size() == 0
+
+
+class TestBackendCache:
+    def setup_method(self):
+        clear_backend_cache()
+
+    def teardown_method(self):
+        clear_backend_cache()
+
+    @patch("src.whispernow.core.asr.transcriber.MODEL_CACHE_SIZE", 1)
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_reload_reuses_unloaded_backend(self, MockBackend):
+        MockBackend.return_value.is_loaded = True
+        MockBackend.return_value.device = "cpu"
+
+        first = TranscriptionEngine(model_name="model-a")
+        first.load_model()
+        first.unload()
+
+        second = TranscriptionEngine(model_name="model-a")
+        second.load_model()
+
+        assert MockBackend.call_count == 1
+        MockBackend.return_value.load.assert_called_once()
+        MockBackend.return_value.unload.assert_not_called()
+        assert second.is_ready
+
+    @patch("src.whispernow.core.asr.transcriber.MODEL_CACHE_SIZE", 1)
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_fresh_load_is_warmed_up_once(self, MockBackend):
+        MockBackend.return_value.is_loaded = True
+        MockBackend.return_value.device = "cpu"
+
+        engine = TranscriptionEngine(model_name="model-a")
+        engine.load_model(warm_up=True)
+        engine.unload()
+        engine.load_model(warm_up=True)
+
+        MockBackend.return_value.transcribe.assert_called_once()
+
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_lazy_load_on_transcribe_skips_warm_up(self, MockBackend):
+        MockBackend.return_value.is_loaded = True
+        MockBackend.return_value.device = "cpu"
+        MockBackend.return_value.transcribe.return_value = MagicMock(text="hi")
+
+        engine = TranscriptionEngine(model_name="model-a")
+        audio = np.ones(16000, dtype=np.float32)
+
+        assert engine.transcribe(audio) == "hi"
+        MockBackend.return_value.transcribe.assert_called_once_with(
+            audio_data=audio, sample_rate=16000
+        )
+
+    @patch("src.whispernow.core.asr.transcriber.MODEL_CACHE_SIZE", 1)
+    @patch("src.whispernow.core.asr.transcriber.gc.collect")
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_unload_only_collects_when_freeing_memory(self, MockBackend, mock_collect):
+        MockBackend.return_value.is_loaded = True
+        MockBackend.return_value.device = "cpu"
+
+        engine = TranscriptionEngine(model_name="model-a")
+        engine.load_model()
+        engine.unload()
+        mock_collect.assert_not_called()
+
+        engine.load_model()
+        engine.unload(free_memory=True)
+        MockBackend.return_value.unload.assert_called_once()
+        mock_collect.assert_called_once()
+
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_model_switch_releases_old_backend_by_default(self, MockBackend):
+        backends = [MagicMock(is_loaded=True, device="cpu") for _ in range(2)]
+        MockBackend.side_effect = backends
+
+        engine = TranscriptionEngine(model_name="model-a")
+        engine.load_model()
+        engine.switch_model("model-b")
+
+        backends[0].unload.assert_called_once()
+        backends[1].unload.assert_not_called()
+
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_unload_with_free_memory_releases_backend(self, MockBackend):
+        MockBackend.return_value.is_loaded = True
+        MockBackend.return_value.device = "cpu"
+
+        engine = TranscriptionEngine(model_name="model-a")
+        engine.load_model()
+        engine.unload(free_memory=True)
+        engine.load_model()
+
+        assert MockBackend.call_count == 2
+        MockBackend.return_value.unload.assert_called_once()
+
+    @patch("src.whispernow.core.asr.transcriber.MODEL_CACHE_SIZE", 1)
+    @patch("src.whispernow.core.asr.transcriber.SherpaOnnxBackend")
+    def test_least_recently_used_backend_is_evicted(self, MockBackend):
+        backends = [MagicMock(is_loaded=True, device="cpu") for _ in range(2)]
+        MockBackend.side_effect = backends
+
+        engine = TranscriptionEngine(model_name="model-a")
+        engine.load_model()
+        engine.switch_model("model-b")
+        engine.unload()
+
+        backends[0].unload.assert_called_once()
+        backends[1].unload.assert_not_called()
+
+
 class TestTranscribeChunked:
     @patch("src.whispernow.core.asr.transcriber.needs_chunking")
     def test_transcribe_chunked_orchestration(self, mock_needs_chunking):
@@ -60,21 +200,41 @@ class TestTranscribeChunked:
 
         chunk1 = MagicMock()
         chunk2 = MagicMock()
-        engine._audio_processor.split_audio.return_value = [chunk1, chunk2]
+        engine._audio_processor.split_audio_iter.return_value = iter(
+            [(0, chunk1), (16000, chunk2)]
+        )
 
-        engine.transcribe = MagicMock(side_effect=["Part1", "Part2"])
+        engine.transcribe_batch = MagicMock(return_value=["Part1", "Part2"])
 
         engine._audio_processor.combine_transcriptions.return_value = "Part1 Part2"
 
-        result = engine.transcribe_chunked(MagicMock(), 16000)
+        result = engine.transcribe_chunked(np.zeros(16000, dtype=np.float32), 16000)
 
         assert result == "Part1 Part2"
-        assert engine.transcribe.call_count == 2
-        engine._audio_processor.split_audio.assert_called_once()
+        engine.transcribe_batch.assert_called_once_with([chunk1, chunk2], 16000)
+        engine._audio_processor.split_audio_iter.assert_called_once()
         engine._audio_processor.combine_transcriptions.assert_called_once_with(
             ["Part1", "Part2"]
         )
 
+    @patch("src.whispernow.core.asr.transcriber.TRANSCRIBE_BATCH_SIZE", 2)
+    @patch("src.whispernow.core.asr.transcriber.needs_chunking")
+    def test_transcribe_chunked_batches_chunks(self, mock_needs_chunking):
+        mock_needs_chunking.return_value = True
+
+        engine = TranscriptionEngine()
+        engine._audio_processor = MagicMock()
+        chunks = [MagicMock() for _ in range(3)]
+        engine._audio_processor.split_audio_iter.return_value = iter(enumerate(chunks))
+        engine.transcribe_batch = MagicMock(side_effect=[["A", ""], ["C"]])
+
+        engine.transcribe_chunked(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert engine.transcribe_batch.call_count == 2
+        engine._audio_processor.combine_transcriptions.assert_called_once_with(
+            ["A", "C"]
+        )
+
 
 @pytest.mark.slow
 class TestEngineIntegration:
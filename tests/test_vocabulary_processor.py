@@ -78,3 +78,33 @@ class TestApplyVocabularyReplacements:
         replacements = [("(regex)", "patterns"), ("[matching]", "selection")]
         result = apply_vocabulary_replacements(text, replacements)
         assert result == "Use patterns for selection"
+
+    def test_replaced_text_is_not_rescanned(self):
+        text = "alpha beta"
+        replacements = [("alpha", "beta"), ("beta", "gamma")]
+        result = apply_vocabulary_replacements(text, replacements)
+        assert result == "beta gamma"
+
+    def test_backslashes_in_replacement_kept_literally(self):
+        text = "open the share"
+        replacements = [("the share", r"\\server\1")]
+        result = apply_vocabulary_replacements(text, replacements, case_sensitive=False)
+        assert result == r"open \\server\1"
+
+    def test_longest_overlapping_rule_wins(self):
+        text = "Meet me in New York"
+        replacements = [("New", "Old"), ("New York", "NYC")]
+        result = apply_vocabulary_replacements(text, replacements)
+        assert result == "Meet me in NYC"
+
+    def test_rules_sharing_prefixes(self):
+        text = "cat catalog category cab"
+        replacements = [("cat", "dog"), ("catalog", "index"), ("cab", "taxi")]
+        result = apply_vocabulary_replacements(text, replacements)
+        assert result == "dog index dogegory taxi"
+
+    def test_single_character_rules(self):
+        text = "“quoted” – dash"
+        replacements = [("“", '"'), ("”", '"'), ("–", "-")]
+        result = apply_vocabulary_replacements(text, replacements)
+        assert result == '"quoted" - dash'